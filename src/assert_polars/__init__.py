@@ -1,8 +1,44 @@
 """assert-polars - Simple inline data validation for Polars."""
 
-from assert_polars.core import hello, verify
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from assert_polars.errors import CheckError
-from assert_polars.predicates import is_uniq
+
+if TYPE_CHECKING:
+    from assert_polars.core import hello, verify, verify_all
+    from assert_polars.predicates import is_uniq
 
 __version__ = "0.2.1"
-__all__ = ["hello", "verify", "CheckError", "is_uniq", "__version__"]
+__all__ = ["hello", "verify", "verify_all", "CheckError", "is_uniq", "__version__"]
+
+# Public names loaded on first access (PEP 562). They live in modules that
+# import Polars, so deferring them means e.g. `from assert_polars import
+# CheckError` doesn't pay for importing Polars
+_LAZY_ATTRS = {
+    "hello": "assert_polars.core",
+    "verify": "assert_polars.core",
+    "verify_all": "assert_polars.core",
+    "is_uniq": "assert_polars.predicates",
+}
+
+# Subpackages, also resolved on first access so `assert_polars.core.verify`
+# keeps working without an explicit submodule import
+_LAZY_SUBPACKAGES = ("core", "predicates")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBPACKAGES:
+        value = import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBPACKAGES))
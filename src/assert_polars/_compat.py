@@ -0,0 +1,45 @@
+"""Helpers for running queries across frame types and Polars versions."""
+
+from __future__ import annotations
+
+import polars as pl
+
+
+def _polars_version() -> tuple[int, ...]:
+    """Parse the leading numeric parts of ``pl.__version__``."""
+    parts = []
+    for part in pl.__version__.split(".")[:3]:
+        digits = "".join(ch for ch in part if ch.isdigit())
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+
+# Polars 1.25 deprecated `collect(streaming=True)` in favour of
+# `engine="streaming"`, and 2.0 removed the old keyword
+if _polars_version() >= (1, 25):
+    _STREAMING_KWARGS: dict = {"engine": "streaming"}
+else:
+    _STREAMING_KWARGS = {"streaming": True}
+
+
+def collect(lf: pl.LazyFrame, *, streaming: bool = False) -> pl.DataFrame:
+    """Collect a LazyFrame, optionally with the streaming engine."""
+    if streaming:
+        return lf.collect(**_STREAMING_KWARGS)
+    return lf.collect()
+
+
+def evaluate(
+    df: pl.DataFrame | pl.LazyFrame, exprs: pl.Expr | list[pl.Expr]
+) -> pl.DataFrame:
+    """Evaluate aggregations against either frame type.
+
+    DataFrames use an eager select, which skips the lazy planner's fixed
+    cost. Anything else is collected with the streaming engine, so frames
+    scanned from disk are reduced in bounded memory.
+    """
+    if type(df) is pl.DataFrame:
+        return df.select(exprs)
+    return collect(df.lazy().select(exprs), streaming=True)
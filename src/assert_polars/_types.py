@@ -0,0 +1,50 @@
+"""Shared types for verify() and the predicates."""
+
+from __future__ import annotations
+
+from typing import Callable, Union
+
+import polars as pl
+
+from assert_polars.errors import CheckError
+
+# Type alias for both DataFrame types
+FrameType = pl.DataFrame | pl.LazyFrame
+
+# Type for what verify() accepts: expression or callable predicate
+CheckType = Union[pl.Expr, Callable[[FrameType], FrameType]]
+
+
+class CountPredicate:
+    """A predicate callable that can also be fused into a single query.
+
+    Calling it checks a frame like any other predicate. ``fail_expr`` is an
+    aggregation returning the number of failures, which lets verify_all()
+    evaluate it in the same query as expression checks.
+
+    Attributes:
+        fail_expr: Aggregation returning the failure count
+        name: Check name reported on CheckError
+        msg_fn: Builds the error message from the failure count
+    """
+
+    __slots__ = ("_check", "fail_expr", "name", "msg_fn")
+
+    def __init__(
+        self,
+        check: Callable[[FrameType], FrameType],
+        fail_expr: pl.Expr,
+        name: str,
+        msg_fn: Callable[[int], str],
+    ):
+        self._check = check
+        self.fail_expr = fail_expr
+        self.name = name
+        self.msg_fn = msg_fn
+
+    def __call__(self, df: FrameType) -> FrameType:
+        return self._check(df)
+
+    def error(self, fail_count: int) -> CheckError:
+        """Build the CheckError for ``fail_count`` failures."""
+        return CheckError(self.msg_fn(fail_count), check_name=self.name)
@@ -1,6 +1,6 @@
 """Core validation functions."""
 
 from assert_polars.core.hello import hello
-from assert_polars.core.verify import verify
+from assert_polars.core.verify import verify, verify_all
 
-__all__ = ["hello", "verify"]
+__all__ = ["hello", "verify", "verify_all"]
@@ -2,27 +2,121 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Union
+import json
+import operator
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
 import polars as pl
 
+from assert_polars._compat import evaluate
+from assert_polars._types import CheckType, CountPredicate, FrameType
 from assert_polars.errors import CheckError
 
 if TYPE_CHECKING:
     pass
 
-# Type alias for both DataFrame types
-FrameType = pl.DataFrame | pl.LazyFrame
+# Comparison ops eligible for the eager Series fast path, keyed by the op name
+# Polars uses in its serialized expression tree
+_COMPARE_OPS = {
+    "Gt": operator.gt,
+    "GtEq": operator.ge,
+    "Lt": operator.lt,
+    "LtEq": operator.le,
+    "Eq": operator.eq,
+    "NotEq": operator.ne,
+}
 
-# Type for what verify() accepts: expression or callable predicate
-CheckType = Union[pl.Expr, Callable[[FrameType], FrameType]]
 
+def _to_scalar(df: FrameType, expr: pl.Expr):
+    """Run a single-value aggregation and extract the scalar.
+
+    No explicit column projection is added: Polars' projection pushdown
+    already limits scans to the columns ``expr`` reads, and checks with no
+    root column (literals, regex selectors) would break under one.
+    """
+    # .item() is as fast as .row(0)[0] and also asserts the 1x1 shape
+    return evaluate(df, expr).item()
+
+
+def _fail_count_expr(check: pl.Expr) -> pl.Expr:
+    """Build an aggregation counting the rows where ``check`` is False.
+
+    Nulls stay null under ``~`` and are skipped by the sum, so they pass.
+    Aggregated checks such as ``pl.col('x').max() < 100`` count as a single
+    value, not one per frame row.
+    """
+    return (~check).sum()
 
-def _to_scalar(result: pl.DataFrame | pl.LazyFrame):
-    """Collect LazyFrame if needed and extract single scalar value."""
-    if isinstance(result, pl.LazyFrame):
-        result = result.collect()
-    return result.item()
+
+def _try_fast_numeric(
+    check: pl.Expr,
+) -> tuple[str, Callable[[pl.Series, Any], pl.Series], Any] | None:
+    """Match ``pl.col(name) <op> <numeric literal>`` checks.
+
+    Returns ``(name, op, value)`` when the check has that shape, else None.
+    Such checks can be evaluated directly on the column Series for eager
+    DataFrames, skipping the query planner. Only untyped Python int/float
+    literals are matched; anything else takes the query path.
+    """
+    # Cheap pre-filter before serializing: the left input must be a bare
+    # column (meta.pop() returns the inputs in reverse order)
+    inputs = check.meta.pop()
+    if len(inputs) != 2 or not inputs[1].meta.is_column():
+        return None
+
+    try:
+        node = json.loads(check.meta.serialize(format="json"))
+    except pl.exceptions.ComputeError:
+        # Not serializable (e.g. Python UDFs)
+        return None
+
+    binary = node.get("BinaryExpr") if isinstance(node, dict) else None
+    if not binary or binary.get("op") not in _COMPARE_OPS:
+        return None
+    left, right = binary.get("left"), binary.get("right")
+    name = left.get("Column") if isinstance(left, dict) else None
+    literal = right.get("Literal") if isinstance(right, dict) else None
+    dyn = literal.get("Dyn") if isinstance(literal, dict) else None
+    if not isinstance(name, str) or not isinstance(dyn, dict) or len(dyn) != 1:
+        return None
+
+    # Non-finite floats serialize as null
+    kind, value = next(iter(dyn.items()))
+    if kind not in ("Int", "Float") or value is None:
+        return None
+    return name, _COMPARE_OPS[binary["op"]], value
+
+
+def _fast_fail_count(
+    df: pl.DataFrame,
+    name: str,
+    op: Callable[[pl.Series, Any], pl.Series],
+    value: Any,
+) -> int | None:
+    """Count failures of a matched comparison directly on the column Series.
+
+    Returns None when the column is not an integer or float column (Decimal
+    Series comparisons can fail where the query path succeeds), or the literal
+    doesn't fit the column dtype (e.g. ``Int8 < 1000``), so the caller falls
+    back to the query path, which compares in the common supertype.
+    """
+    col = df.get_column(name)
+    if not (col.dtype.is_integer() or col.dtype.is_float()):
+        return None
+    try:
+        mask = op(col, value)
+    except OverflowError:
+        return None
+    return len(mask) - mask.sum() - mask.null_count()
+
+
+def _expr_failure(check: pl.Expr, fail_count: int) -> CheckError:
+    """Build the CheckError for an expression check with failing rows."""
+    return CheckError(
+        f"verify({check}) failed: {fail_count} row(s)",
+        check_name="verify",
+    )
 
 
 def verify(check: CheckType) -> Callable[[FrameType], FrameType]:
@@ -47,26 +141,114 @@ def verify(check: CheckType) -> Callable[[FrameType], FrameType]:
         A function that takes a DataFrame and returns it unchanged if valid
 
     Raises:
-        CheckError: If validation fails
+        TypeError: If check is neither a pl.Expr nor a callable
+        CheckError: If validation fails (raised by the returned function)
     """
-    def _verify(df: FrameType) -> FrameType:
-        # Case 1: Polars expression
-        if isinstance(check, pl.Expr):
-            fail_count = _to_scalar(df.select((~check).sum()))
+    # Dispatch on the check type once, here, rather than per DataFrame
+
+    # Case 1: Polars expression
+    if isinstance(check, pl.Expr):
+        # Build the failure-count expression once, not per DataFrame
+        fail_expr = _fail_count_expr(check)
+        fast = None
+        matched = False
+
+        def _verify_expr(df: FrameType) -> FrameType:
+            nonlocal fast, matched
+            fail_count = None
+            # Identity checks on frame types only pick an optimisation, so a
+            # subclass just takes the general path
+            if type(df) is pl.DataFrame:
+                # Match the fast-path shape on the first eager frame only and
+                # cache it, so checks only ever given LazyFrames never pay
+                if not matched:
+                    fast = _try_fast_numeric(check)
+                    matched = True
+                if fast is not None:
+                    fail_count = _fast_fail_count(df, *fast)
+            if fail_count is None:
+                fail_count = _to_scalar(df, fail_expr)
             if fail_count > 0:
-                raise CheckError(
-                    f"verify({check}) failed: {fail_count} row(s)",
-                    check_name="verify",
-                )
+                raise _expr_failure(check, fail_count)
             return df
 
-        # Case 2: Callable predicate (is_uniq, not_null, etc.)
-        if callable(check):
-            return check(df)
+        return _verify_expr
+
+    # Case 2: Callable predicate (is_uniq, not_null, etc.). Predicates are
+    # already FrameType -> FrameType, so hand them back without a wrapper.
+    if callable(check):
+        return check
+
+    # Case 3: Unknown type
+    raise TypeError(
+        f"verify() expects pl.Expr or callable, got {type(check).__name__}"
+    )
 
-        # Case 3: Unknown type
-        raise TypeError(
-            f"verify() expects pl.Expr or callable, got {type(check).__name__}"
-        )
 
-    return _verify
+def verify_all(*checks: CheckType) -> Callable[[FrameType], FrameType]:
+    """
+    Verify a DataFrame against several checks, fusing expressions into one query.
+
+    Equivalent to chaining ``.pipe(verify(check))`` for each check, but all
+    Polars expression checks are evaluated together in a single pass over
+    the data instead of one query per check. This is the fast path for
+    pipelines with many checks.
+
+    Usage:
+        df.pipe(verify_all(
+            pl.col('price') > 0,
+            pl.col('status').is_in(['A', 'B']),
+            is_uniq('id'),
+        ))
+
+    Predicates built on a failure-count expression (such as is_uniq) are
+    fused into the same query. Other predicate callables cannot be fused;
+    they run first, one after another. If several fused checks fail, the
+    error reports the first one in argument order.
+
+    Args:
+        *checks: Polars expressions (pl.Expr) and/or predicate callables
+
+    Returns:
+        A function that takes a DataFrame and returns it unchanged if valid
+
+    Raises:
+        ValueError: If no checks provided
+        TypeError: If any check is neither a pl.Expr nor a callable
+        CheckError: If validation fails (raised by the returned function)
+    """
+    if not checks:
+        raise ValueError("verify_all() requires at least one check")
+
+    # Fusable checks as (failure-count expression, error builder) pairs
+    fused: list[tuple[pl.Expr, Callable[[int], CheckError]]] = []
+    predicates: list[Callable[[FrameType], FrameType]] = []
+    for check in checks:
+        if isinstance(check, pl.Expr):
+            fused.append((_fail_count_expr(check), partial(_expr_failure, check)))
+        elif isinstance(check, CountPredicate):
+            fused.append((check.fail_expr, check.error))
+        elif callable(check):
+            predicates.append(check)
+        else:
+            raise TypeError(
+                "verify_all() expects pl.Expr or callable, "
+                f"got {type(check).__name__}"
+            )
+
+    # One aliased failure count per fused check, built once
+    fail_exprs = [expr.alias(f"_check_{i}") for i, (expr, _) in enumerate(fused)]
+    errors = [error for _, error in fused]
+
+    def _verify_all(df: FrameType) -> FrameType:
+        for predicate in predicates:
+            predicate(df)
+
+        if fail_exprs:
+            counts = evaluate(df, fail_exprs).row(0)
+            for error, fail_count in zip(errors, counts):
+                if fail_count > 0:
+                    raise error(fail_count)
+        return df
+
+    return _verify_all
@@ -2,26 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING
 
 import polars as pl
 
+from assert_polars._compat import evaluate
+from assert_polars._types import CountPredicate, FrameType
 from assert_polars.errors import CheckError
 
 if TYPE_CHECKING:
     pass
 
-FrameType = pl.DataFrame | pl.LazyFrame
 
-
-def is_uniq(*cols: str) -> Callable[[FrameType], FrameType]:
+def is_uniq(*cols: str) -> CountPredicate:
     """Check that column(s) have no duplicate value combinations.
 
     Args:
         *cols: Column names to check for uniqueness
 
     Returns:
-        A callable that validates the DataFrame and returns it unchanged
+        A CountPredicate: callable that validates the DataFrame and returns
+        it unchanged, and also carries a failure-count expression so
+        verify_all() can run it in the same query as other checks.
 
     Raises:
         ValueError: If no columns provided
@@ -34,25 +36,46 @@ def is_uniq(*cols: str) -> Callable[[FrameType], FrameType]:
     if not cols:
         raise ValueError("is_uniq() requires at least one column")
 
+    # Build key expressions once, not per DataFrame. Composite keys are
+    # tested on a UInt64 row hash, which is cheaper to dedupe than the
+    # struct itself; the exact struct key is kept for the failure count.
+    if len(cols) == 1:
+        key = pl.col(cols[0])
+        probe = key
+    else:
+        key = pl.struct(*cols)
+        probe = key.hash()
+    has_dupe_expr = probe.n_unique() < pl.len()
+    n_dupes_expr = key.is_duplicated().sum()
+    msg_tail = f" duplicate(s) in {list(cols)}"
+
+    def _message(n_dupes: int) -> str:
+        return f"is_uniq failed: {n_dupes}{msg_tail}"
+
     def _check(df: FrameType) -> FrameType:
-        # Build expression for duplicate detection
-        if len(cols) == 1:
-            expr = pl.col(cols[0]).is_duplicated()
-        else:
-            expr = pl.struct(*cols).is_duplicated()
-
-        # Handle LazyFrame vs DataFrame
-        result = df.select(expr.sum())
-        if isinstance(result, pl.LazyFrame):
-            result = result.collect()
-        n_dupes = result.item()
-
-        if n_dupes > 0:
-            col_list = list(cols)
-            raise CheckError(
-                f"is_uniq failed: {n_dupes} duplicate(s) in {col_list}",
-                check_name="is_uniq",
-            )
-        return df
-
-    return _check
+        # Fewer than two rows can't hold a duplicate; skip the query entirely.
+        # LazyFrame height isn't known without running a query, so no skip.
+        if type(df) is pl.DataFrame and df.height < 2:
+            # Still resolve the columns, so a typo raises ColumnNotFoundError
+            # just like the query path
+            for col in cols:
+                df.get_column(col)
+            return df
+
+        # Cheap existence test first: fewer distinct keys than rows means a
+        # duplicate exists. Needs the hash set only, no per-row mask.
+        has_dupe = evaluate(df, has_dupe_expr).item()
+        if not has_dupe:
+            return df
+
+        # Failure path only: count every row involved in a duplicate
+        n_dupes = evaluate(df, n_dupes_expr).item()
+        if n_dupes == 0:
+            # Row-hash collision, not a real duplicate
+            return df
+
+        raise CheckError(_message(n_dupes), check_name="is_uniq")
+
+    # Exposes the exact duplicate count so verify_all() can fuse this check
+    # with others; on its own, _check's cheaper hash probe runs instead
+    return CountPredicate(_check, n_dupes_expr, "is_uniq", _message)
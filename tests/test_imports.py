@@ -0,0 +1,69 @@
+"""Tests for the package import surface."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import assert_polars
+
+
+def _run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter and return its stdout."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return result.stdout.strip()
+
+
+class TestImports:
+    """Tests for lazy loading of the public API."""
+
+    def test_check_error_import_does_not_load_polars(self):
+        """Importing CheckError alone doesn't import Polars."""
+        out = _run_isolated(
+            "import sys; from assert_polars import CheckError; "
+            "print('polars' in sys.modules)"
+        )
+        assert out == "False"
+
+    def test_verify_import_loads_polars(self):
+        """Accessing verify loads the Polars-backed modules."""
+        out = _run_isolated(
+            "import sys; from assert_polars import verify; "
+            "print('polars' in sys.modules)"
+        )
+        assert out == "True"
+
+    def test_all_public_names_resolve(self):
+        """Every name in __all__ is importable from the package."""
+        for name in assert_polars.__all__:
+            assert getattr(assert_polars, name) is not None
+
+    def test_subpackages_resolve_as_attributes(self):
+        """Subpackages are reachable as attributes of a bare package import."""
+        out = _run_isolated(
+            "import assert_polars as ap; "
+            "print(ap.core.verify is ap.verify, "
+            "ap.predicates.is_uniq is ap.is_uniq)"
+        )
+        assert out == "True True"
+
+    def test_subpackage_attribute_does_not_load_polars_early(self):
+        """Importing the package alone still leaves Polars unloaded."""
+        out = _run_isolated(
+            "import sys; import assert_polars; "
+            "print('polars' in sys.modules, 'core' in dir(assert_polars))"
+        )
+        assert out == "False True"
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError as usual."""
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            assert_polars.nope
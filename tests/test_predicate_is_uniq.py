@@ -32,6 +32,18 @@ class TestIsUniq:
         result = df.pipe(verify(is_uniq("id")))
         assert result.equals(df)
 
+    def test_single_row_passes(self):
+        """Single row DataFrame can't have duplicates."""
+        df = pl.DataFrame({"id": [1]})
+        result = df.pipe(verify(is_uniq("id")))
+        assert result.equals(df)
+
+    def test_empty_lazyframe_passes(self):
+        """Empty LazyFrame has no duplicates."""
+        lf = pl.LazyFrame({"id": []}, schema={"id": pl.Int64})
+        result = lf.pipe(verify(is_uniq("id")))
+        assert isinstance(result, pl.LazyFrame)
+
     # --- Failing cases ---
 
     def test_single_column_duplicates_fails(self):
@@ -49,6 +61,24 @@ class TestIsUniq:
         with pytest.raises(CheckError, match="2 duplicate"):
             df.pipe(verify(is_uniq("city_id", "year")))
 
+    def test_count_includes_every_duplicated_row(self):
+        """Reported count covers all rows sharing a key, not just extras."""
+        df = pl.DataFrame({"id": [1, 1, 1, 2]})
+        with pytest.raises(CheckError, match="3 duplicate"):
+            df.pipe(verify(is_uniq("id")))
+
+    def test_repeated_nulls_fail(self):
+        """Nulls compare equal to each other for uniqueness."""
+        df = pl.DataFrame({"id": [None, None, 1]})
+        with pytest.raises(CheckError, match="2 duplicate"):
+            df.pipe(verify(is_uniq("id")))
+
+    def test_multi_column_nulls_in_key_fail(self):
+        """Composite keys with matching nulls count as duplicates."""
+        df = pl.DataFrame({"a": [1, 1, 2], "b": [None, None, None]})
+        with pytest.raises(CheckError, match="2 duplicate"):
+            df.pipe(verify(is_uniq("a", "b")))
+
     # --- Error attributes ---
 
     def test_check_name_is_is_uniq(self):
@@ -71,6 +101,15 @@ class TestIsUniq:
         with pytest.raises(ValueError, match="at least one column"):
             is_uniq()
 
+    @pytest.mark.parametrize("ids", [[], [1], [1, 2]])
+    def test_missing_column_raises(self, ids):
+        """Unknown columns raise at any frame height, including tiny frames."""
+        df = pl.DataFrame({"a": ids}, schema={"a": pl.Int64})
+        with pytest.raises(pl.exceptions.ColumnNotFoundError):
+            df.pipe(verify(is_uniq("z")))
+        with pytest.raises(pl.exceptions.ColumnNotFoundError):
+            df.pipe(verify(is_uniq("a", "z")))
+
     # --- LazyFrame support ---
 
     def test_works_with_lazyframe(self):
@@ -79,6 +118,19 @@ class TestIsUniq:
         result = lf.pipe(verify(is_uniq("id")))
         assert isinstance(result, pl.LazyFrame)
 
+    def test_lazyframe_duplicates_fails(self):
+        """Duplicates in a LazyFrame raise with the same count."""
+        lf = pl.LazyFrame({"a": [1, 1, 2], "b": [3, 3, 4]})
+        with pytest.raises(CheckError, match="2 duplicate"):
+            lf.pipe(verify(is_uniq("a", "b")))
+
+    # --- verify() integration ---
+
+    def test_verify_returns_predicate_unwrapped(self):
+        """verify() hands predicates back as-is, with no wrapper frame."""
+        check = is_uniq("id")
+        assert verify(check) is check
+
     # --- Chaining ---
 
     def test_chaining_with_other_checks(self):
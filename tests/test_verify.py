@@ -81,6 +81,72 @@ class TestVerifyPolarsExpressionTypes:
         assert result.equals(df)
 
 
+class TestVerifyFastPath:
+    """Simple column-vs-literal checks on eager DataFrames skip the planner.
+
+    These must give the same results as the lazy query path.
+    """
+
+    @pytest.mark.parametrize(
+        "check, n_fail",
+        [
+            (pl.col("x") > 0, 2),
+            (pl.col("x") >= 0, 1),
+            (pl.col("x") < 2, 1),
+            (pl.col("x") <= 2, 0),
+            (pl.col("x") == 1, 3),
+            (pl.col("x") != 1, 1),
+            (pl.col("x") > 0.5, 2),
+        ],
+    )
+    def test_matches_lazy_path(self, check, n_fail):
+        """Eager and lazy inputs report the same failure count."""
+        df = pl.DataFrame({"x": [-1, 0, 1, 2, None]})
+        for frame in (df, df.lazy()):
+            if n_fail == 0:
+                frame.pipe(verify(check))
+            else:
+                with pytest.raises(CheckError, match=f"{n_fail} row"):
+                    frame.pipe(verify(check))
+
+    @pytest.mark.parametrize(
+        "dtype, check, n_fail",
+        [
+            (pl.Int8, pl.col("x") < 1000, 0),
+            (pl.Int8, pl.col("x") > 1000, 2),
+            (pl.UInt8, pl.col("x") > -1, 0),
+            (pl.UInt8, pl.col("x") < -1, 2),
+            (pl.Int64, pl.col("x") < 2**63, 0),
+            (pl.Int8, pl.col("x") < 1.5, 1),
+            (pl.Decimal(10, 2), pl.col("x") > 0.1, 0),
+            (pl.Decimal(10, 2), pl.col("x") < 0.1, 2),
+            (pl.Decimal(10, 2), pl.col("x") > 1e300, 2),
+            (pl.Decimal(10, 2), pl.col("x") > -1e300, 0),
+        ],
+    )
+    def test_out_of_range_literal_matches_lazy_path(self, dtype, check, n_fail):
+        """Literals outside the column dtype's range don't break eager frames."""
+        df = pl.DataFrame({"x": [1, 2]}, schema={"x": dtype})
+        for frame in (df, df.lazy()):
+            if n_fail == 0:
+                frame.pipe(verify(check))
+            else:
+                with pytest.raises(CheckError, match=f"{n_fail} row"):
+                    frame.pipe(verify(check))
+
+    def test_non_numeric_column_falls_back(self):
+        """String columns still go through the expression engine."""
+        df = pl.DataFrame({"x": ["a", "b", "a"]})
+        with pytest.raises(CheckError, match="1 row"):
+            df.pipe(verify(pl.col("x") == "a"))
+
+    def test_missing_column_raises(self):
+        """Unknown columns raise Polars' error, as on the lazy path."""
+        df = pl.DataFrame({"x": [1, 2, 3]})
+        with pytest.raises(pl.exceptions.ColumnNotFoundError):
+            df.pipe(verify(pl.col("y") > 0))
+
+
 class TestVerifyDataFrameTypes:
     """Tests for DataFrame and LazyFrame support."""
 
@@ -96,6 +162,12 @@ class TestVerifyDataFrameTypes:
         result = lf.pipe(verify(pl.col("x") > 0))
         assert isinstance(result, pl.LazyFrame)
 
+    def test_lazyframe_fails_with_count(self):
+        """LazyFrame failures report the same count as DataFrames."""
+        lf = pl.LazyFrame({"x": [1, -1, None, -3]})
+        with pytest.raises(CheckError, match="2 row"):
+            lf.pipe(verify(pl.col("x") > 0))
+
     def test_returns_same_type_as_input(self):
         """Output type matches input type."""
         df = pl.DataFrame({"x": [1, 2, 3]})
@@ -114,6 +186,12 @@ class TestVerifyEdgeCases:
         result = df.pipe(verify(pl.col("x") > 0))
         assert result.equals(df)
 
+    def test_empty_dataframe_aggregate_check_still_runs(self):
+        """Empty frames are still evaluated: frame-level checks can fail."""
+        df = pl.DataFrame({"x": []}).cast({"x": pl.Int64})
+        with pytest.raises(CheckError, match="1 row"):
+            df.pipe(verify(pl.len() > 0))
+
     def test_single_row_passes(self):
         """Single row DataFrame works."""
         df = pl.DataFrame({"x": [1]})
@@ -143,6 +221,36 @@ class TestVerifyEdgeCases:
         result = df.pipe(verify(pl.col("x") > 0))
         assert result.equals(df)
 
+    def test_nulls_not_counted_as_failures(self):
+        """Only False rows are counted as failures, never nulls."""
+        df = pl.DataFrame({"x": [None, -1, None, 3]})
+        with pytest.raises(CheckError, match="1 row"):
+            df.pipe(verify(pl.col("x") > 0))
+
+    def test_aggregated_expression_passes(self):
+        """Scalar (aggregated) checks are counted once, not per row."""
+        df = pl.DataFrame({"x": [1, 2, 3]})
+        result = df.pipe(verify(pl.col("x").max() < 100))
+        assert result.equals(df)
+
+    def test_aggregated_expression_fails(self):
+        """A failing scalar check reports a single failure."""
+        df = pl.DataFrame({"x": [1, 2, 3]})
+        with pytest.raises(CheckError, match="1 row"):
+            df.pipe(verify(pl.col("x").sum() > 100))
+
+    def test_literal_expression(self):
+        """Checks that reference no column still see every row."""
+        df = pl.DataFrame({"x": [1, 2, 3]})
+        result = df.pipe(verify(pl.lit(True)))
+        assert result.equals(df)
+
+    def test_regex_column_selector(self):
+        """Regex column selectors are resolved against the full frame."""
+        df = pl.DataFrame({"x1": [1, 2, 3], "y": [0, 0, 0]})
+        with pytest.raises(CheckError, match="1 row"):
+            df.lazy().pipe(verify(pl.col("^x.*$") > 1))
+
     def test_multiple_columns_in_expression(self):
         """Expression can reference multiple columns."""
         df = pl.DataFrame({"a": [1, 2, 3], "b": [0, 1, 2]})
@@ -158,3 +266,8 @@ class TestVerifyEdgeCases:
             .pipe(verify(pl.col("y").is_in(["a", "b", "c"])))
         )
         assert result.equals(df)
+
+    def test_invalid_check_type_raises_typeerror(self):
+        """Non-Expr, non-callable checks are rejected when verify() is called."""
+        with pytest.raises(TypeError, match="expects pl.Expr or callable"):
+            verify("x > 0")
@@ -0,0 +1,105 @@
+"""Tests for verify_all() - fused multi-check verification."""
+
+import polars as pl
+import pytest
+
+from assert_polars import verify_all, is_uniq, CheckError
+
+
+class TestVerifyAll:
+    """Tests for verify_all() with expressions and predicates."""
+
+    # --- Passing cases ---
+
+    def test_passes_when_all_checks_pass(self):
+        """All expressions satisfied returns the frame unchanged."""
+        df = pl.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "a"]})
+        result = df.pipe(verify_all(pl.col("x") > 0, pl.col("y").is_in(["a", "b"])))
+        assert result.equals(df)
+
+    def test_mixed_expressions_and_predicates_pass(self):
+        """Predicates and expressions can be combined."""
+        df = pl.DataFrame({"id": [1, 2, 3], "x": [1, 2, 3]})
+        result = df.pipe(verify_all(is_uniq("id"), pl.col("x") > 0))
+        assert result.equals(df)
+
+    def test_same_column_checked_twice(self):
+        """Several checks on one column don't collide on output names."""
+        df = pl.DataFrame({"x": [1, 2, 3]})
+        result = df.pipe(verify_all(pl.col("x") > 0, pl.col("x") < 10))
+        assert result.equals(df)
+
+    # --- Failing cases ---
+
+    def test_fails_with_count_of_failing_check(self):
+        """Failing expression reports its own failure count."""
+        df = pl.DataFrame({"x": [1, -1, -2]})
+        with pytest.raises(CheckError, match="2 row") as exc_info:
+            df.pipe(verify_all(pl.col("x") < 10, pl.col("x") > 0))
+        assert exc_info.value.check_name == "verify"
+
+    def test_reports_first_failing_expression(self):
+        """With several failures, the first in argument order is reported."""
+        df = pl.DataFrame({"x": [-1, 20]})
+        with pytest.raises(CheckError, match=r"1 row"):
+            df.pipe(verify_all(pl.col("x") > 0, pl.col("x") < 10))
+
+    def test_predicate_failure_raises(self):
+        """Failing predicates raise their own CheckError."""
+        df = pl.DataFrame({"id": [1, 1], "x": [1, 2]})
+        with pytest.raises(CheckError) as exc_info:
+            df.pipe(verify_all(pl.col("x") > 0, is_uniq("id")))
+        assert exc_info.value.check_name == "is_uniq"
+
+    def test_fused_predicate_reports_duplicates(self):
+        """is_uniq fused with expressions reports its own error."""
+        df = pl.DataFrame({"a": [1, 1, 2], "b": [3, 3, 4], "x": [1, 2, 3]})
+        msg = r"2 duplicate\(s\) in \['a', 'b'\]"
+        with pytest.raises(CheckError, match=msg) as exc_info:
+            df.pipe(verify_all(pl.col("x") > 0, is_uniq("a", "b")))
+        assert exc_info.value.check_name == "is_uniq"
+
+    def test_fused_checks_report_in_argument_order(self):
+        """Expression and predicate failures are reported in argument order."""
+        df = pl.DataFrame({"id": [1, 1], "x": [-1, 2]})
+        with pytest.raises(CheckError) as exc_info:
+            df.pipe(verify_all(is_uniq("id"), pl.col("x") > 0))
+        assert exc_info.value.check_name == "is_uniq"
+
+    def test_non_fusable_predicate_still_runs(self):
+        """Plain callables are run before the fused query."""
+        calls = []
+
+        def custom(df):
+            calls.append(df)
+            return df
+
+        df = pl.DataFrame({"x": [1, 2]})
+        df.pipe(verify_all(custom, pl.col("x") > 0))
+        assert len(calls) == 1
+
+    # --- Input validation ---
+
+    def test_no_checks_raises_valueerror(self):
+        """Calling verify_all() with no checks raises ValueError."""
+        with pytest.raises(ValueError, match="at least one check"):
+            verify_all()
+
+    def test_invalid_check_type_raises_typeerror(self):
+        """Non-Expr, non-callable checks are rejected up-front."""
+        with pytest.raises(TypeError, match="expects pl.Expr or callable"):
+            verify_all(pl.col("x") > 0, 42)
+
+    # --- LazyFrame support ---
+
+    def test_works_with_lazyframe(self):
+        """Returns LazyFrame when given LazyFrame."""
+        lf = pl.LazyFrame({"x": [1, 2, 3]})
+        result = lf.pipe(verify_all(pl.col("x") > 0, pl.col("x") < 10))
+        assert isinstance(result, pl.LazyFrame)
+
+    def test_lazyframe_fails(self):
+        """LazyFrame failures are reported."""
+        lf = pl.LazyFrame({"x": [1, None, -3]})
+        with pytest.raises(CheckError, match="1 row"):
+            lf.pipe(verify_all(pl.col("x") > 0))